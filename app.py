@@ -14,13 +14,14 @@ writing, software distributed under the License is distributed on an "AS
 IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied.
 """
-import meraki
 from rich.panel import Panel
 
 from funcs import (
+    DASHBOARD_API_SETTINGS,
     EnvironmentManager,
     LoggerManager,
     ArgumentParserManager,
+    CacheManager,
     InvalidArgumentsError,
     get_org_id,
     run_report,
@@ -37,23 +38,27 @@ def main():
 
     # Argument Parsing
     try:
-        product_type, raw_data = ArgumentParserManager.parse_arguments(logger_manager)
+        product_type, raw_data, use_cache = ArgumentParserManager.parse_arguments(logger_manager)
     except InvalidArgumentsError as e:
         logger_manager.logger.error(str(e))
         return
 
+    CacheManager.enabled = use_cache
+
     #  Step 1: Retrieve and Validate Environment Variables
     EnvironmentManager.validate_env_variables()
 
     # Initialize Meraki Dashboard API
+    import meraki
     logger_manager.console.print(Panel.fit("[bold bright_green]Connect to Meraki Dashboard[/bold bright_green]", title="Step 2"))
-    dashboard = meraki.DashboardAPI(api_key=EnvironmentManager.MERAKI_API_KEY, suppress_logging=True)
+    dashboard = meraki.DashboardAPI(api_key=EnvironmentManager.MERAKI_API_KEY, **DASHBOARD_API_SETTINGS)
 
     # Fetch organization ID
     org_id = get_org_id(dashboard, logger_manager)
 
     # Run Report
-    run_report(dashboard, org_id, product_type, logger_manager, EnvironmentManager.TIMESPAN_IN_SECONDS, EnvironmentManager.EXCEL, raw_data)
+    run_report(dashboard, org_id, product_type, logger_manager, EnvironmentManager.TIMESPAN_IN_SECONDS, EnvironmentManager.EXCEL, raw_data,
+               EnvironmentManager.MERAKI_CONCURRENCY, EnvironmentManager.REPORT_FORMAT)
 
     logger_manager.console.print(Panel.fit("[bold bright_green]Script Complete.[/bold bright_green]"))
 
@@ -1,51 +1,147 @@
+import asyncio
+import functools
+import hashlib
+import itertools
 import json
 import logging
+import logging.handlers
 import os
+import re
+import time
 from datetime import datetime
-import meraki
-import pandas as pd
+import orjson
 import rich.logging
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from dotenv import load_dotenv
-from meraki.exceptions import APIError
+
+# pandas and meraki are imported inside the functions that use them; they dominate cold start
+# time and are not needed for `--help` or argument errors
 import sys
 from rich.prompt import Prompt
-from rich.progress import track
+from rich.progress import Progress
 import argparse
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Shared rich console; constructing one probes the terminal, so it is created once per process
+console = Console()
+
+# API client fields used by the filtered (non-raw) report, mapped to their report column names
+CLIENT_FIELD_MAP = {
+    "ip": "IP Address",
+    "mac": "MAC Address",
+    "manufacturer": "Manufacturer",
+    "description": "Description",
+    "ssid": "SSID",
+    "os": "OS",
+    "firstSeen": "First Seen",
+    "lastSeen": "Last Seen",
+    "status": "Status",
+    "user": "User",
+    "recentDeviceSerial": "Meraki Device Serial (Connected to)",
+}
+
+# Meraki SDK settings shared by the sync and asyncio dashboard clients. Rate limiting (429) back-off and
+# retries are left to the SDK rather than throttling calls by hand
+DASHBOARD_API_SETTINGS = {
+    "suppress_logging": True,
+    "wait_on_rate_limit": True,
+    "maximum_retries": 3,
+    "single_request_timeout": 60,
+}
+
+# Network product types that can serve each client type (-o option); "all" fetches every network
+PRODUCT_TYPES_BY_CLIENT_TYPE = {
+    "wireless": frozenset({"wireless"}),
+    "wired": frozenset({"appliance", "switch", "cellularGateway"}),
+}
+
+# Supported report file formats; parquet/feather write a single long-form table
+REPORT_FORMATS = ("xlsx", "parquet", "feather")
+
+# Characters Excel does not allow in sheet names
+INVALID_SHEET_NAME_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+# Leading "YYYY-MM-DDTHH:MM:SS" of the ISO 8601 timestamps the API returns for firstSeen / lastSeen
+ISO_TIMESTAMP_PREFIX = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d")
+
+# Maximum number of client rows rendered in the console report
+MAX_TABLE_ROWS = 200
+
+# Column order of the filtered (non-raw) Excel report
+REPORT_COLUMNS = ["Network Name", "IP Address", "MAC Address", "OUI", "Manufacturer", "Description", "SSID", "OS",
+                  "First Seen", "Last Seen", "Status", "Sent Data", "Received Data", "User",
+                  "Meraki Device Serial (Connected to)"]
+
+# Explicit dtypes for the filtered report columns written to typed formats (parquet/feather)
+REPORT_DTYPES = {
+    "Sent Data": "Float64",
+    "Received Data": "Float64",
+    **{column: "string" for column in REPORT_COLUMNS if column not in ("Sent Data", "Received Data")},
+}
+
+
+def read_env_variables(schema):
+    """
+    Read every variable in `schema` from the environment once. Blank or unparsable values fall back to
+    the schema default, so the parsed value always has the expected type (or is None if unset).
+    """
+    values = {}
+    for var_name, (parser, default, _) in schema.items():
+        raw_value = os.environ.get(var_name, "")
+        try:
+            values[var_name] = parser(raw_value) if raw_value else default
+        except ValueError:
+            values[var_name] = default
+    return values
+
 
 class EnvironmentManager:
-    MERAKI_API_KEY = os.getenv('MERAKI_API_KEY')
-    EXCEL = os.getenv('EXCEL', "False").lower() == "true"  # Default to false if left blank
-    LOGGER_LEVEL = os.getenv('LOGGER_LEVEL', "CRITICAL").upper()
-    try:
-        TIMESPAN_IN_SECONDS = int(os.getenv('TIMESPAN_IN_SECONDS', '86400'))
-    except ValueError:
-        TIMESPAN_IN_SECONDS = 86400  # Default to 86400 seconds (1 day) if left blank or if value is invalid
+    # Variable name: (parser, default, validator). Validators flag values that are set but unusable
+    SCHEMA = {
+        'MERAKI_API_KEY': (str, None, None),
+        'EXCEL': (lambda value: value.lower() == "true", False, None),  # Default to false if left blank
+        'LOGGER_LEVEL': (str.upper, "CRITICAL", None),
+        'TIMESPAN_IN_SECONDS': (int, 86400, lambda value: 1 <= value <= 2678400),  # 1 day default, 31 days max
+        'MERAKI_CONCURRENCY': (int, 5, lambda value: value >= 1),  # Meraki allows ~10 req/s per org
+        'CACHE_TTL_SECONDS': (int, 300, None),
+        'REPORT_FORMAT': (str.lower, "xlsx", lambda value: value in REPORT_FORMATS),
+    }
+    _VALUES = read_env_variables(SCHEMA)
+
+    MERAKI_API_KEY = _VALUES['MERAKI_API_KEY']
+    EXCEL = _VALUES['EXCEL']
+    LOGGER_LEVEL = _VALUES['LOGGER_LEVEL']
+    TIMESPAN_IN_SECONDS = _VALUES['TIMESPAN_IN_SECONDS']
+    MERAKI_CONCURRENCY = _VALUES['MERAKI_CONCURRENCY']
+    CACHE_TTL_SECONDS = _VALUES['CACHE_TTL_SECONDS']
+    REPORT_FORMAT = _VALUES['REPORT_FORMAT']
+    _validated = False
 
     @classmethod
     def validate_env_variables(cls):
+        if cls._validated:  # Already validated and displayed in this process
+            return
         missing_vars = []
-        console = Console()  # Instantiate a console object for rich
+        invalid_vars = []
 
         table = Table()
         table.add_column("Variable", justify="left", style="bright_white", width=30)
         table.add_column("Value", style="bright_white", width=50)
 
-        for var_name, var_value in cls.__dict__.items():
-            if "os" in var_name or "__" in var_name or isinstance(var_value, classmethod):  # ignore class documentation & methods
-                continue
+        for var_name, (_, _, validator) in cls.SCHEMA.items():
+            var_value = getattr(cls, var_name)
             if var_name == 'MERAKI_API_KEY' and var_value is not None:
                 table.add_row(var_name, "OK")
             else:
                 table.add_row(var_name, str(var_value) if var_value is not None else "Not Set")
-            if var_value in ("", None) and var_name not in ["TIMESPAN_IN_SECONDS"]:
+            if var_value in ("", None):
                 missing_vars.append(var_name)
+            elif validator and not validator(var_value):
+                invalid_vars.append(f"{var_name} ({var_value})")
 
         # Display the table
         console.print(Panel.fit(table, title="Step 1: Retrieve and Validate Environment Variables"))
@@ -53,9 +149,22 @@ class EnvironmentManager:
         if missing_vars:
             raise EnvironmentError(f"The following environment variables have not been set: {', '.join(missing_vars)}")
 
-        # Check TIMESPAN_IN_SECONDS separately since we always have a default
-        if not (1 <= cls.TIMESPAN_IN_SECONDS <= 2678400):  # 2678400 = 31 days in seconds
-            raise ValueError(f"TIMESPAN_IN_SECONDS value ({cls.TIMESPAN_IN_SECONDS}) out of range. Please correct timespan in .env file.")
+        if invalid_vars:
+            raise ValueError(f"The following environment variables are out of range or invalid: {', '.join(invalid_vars)}. Please correct them in .env file.")
+
+        cls._validated = True
+
+
+class LazyJson:
+    """
+    Defers JSON serialization of a log payload until a handler formats the record,
+    so nothing is serialized when the log level filters it out.
+    """
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return orjson.dumps(self.data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC).decode()
 
 
 class LoggerManager:
@@ -66,11 +175,16 @@ class LoggerManager:
         'ERROR': logging.ERROR,
         'CRITICAL': logging.CRITICAL,
     }
+    MAX_DISPLAY_ROWS = 50  # Rows rendered per log table; the rest are summarized
+    # Table headers, built once rather than on every log call
+    ORG_WIDE_COLUMNS = tuple(col.capitalize() for col in ["name", "lat", "lng", "address", "notes", "tags", "networkId",
+                                                          "serial", "model", "mac", "lanIp", "firmware", "productType"])
+    NETWORK_COLUMNS = tuple(col.capitalize() for col in ["id", "description", "mac", "ip", "user", "vlan", "switchport"])
 
     def __init__(self):
         self.logger = self.setup()
         self.original_log_level = self.logger.level
-        self.console = Console()
+        self.console = console
 
     def setup(self):
         # Configure logging format for the rich handler
@@ -80,15 +194,18 @@ class LoggerManager:
         console_handler = rich.logging.RichHandler()
         console_handler.setFormatter(logging.Formatter(log_format))
 
-        # Set up the standard logging handler for file output
-        file_handler = logging.FileHandler("app.log", mode='a')
+        # Set up the standard logging handler for file output; the file is opened on first write and
+        # records are buffered and written in batches (errors flush immediately, logging.shutdown
+        # flushes the rest at exit)
+        file_handler = logging.FileHandler("app.log", mode='a', delay=True)
         file_handler.setFormatter(logging.Formatter(log_format))
+        buffered_file_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
 
         # Get logging level from environment variable
         log_level_str = EnvironmentManager.LOGGER_LEVEL  # Ensuring to get the level from the EnvironmentManager
         log_level = self.LOG_LEVELS.get(log_level_str, logging.CRITICAL)  # Default to WARNING if invalid level
         # Configure the logger based on the module's name for better granularity
-        logging.basicConfig(level=log_level, handlers=[console_handler, file_handler])
+        logging.basicConfig(level=log_level, handlers=[console_handler, buffered_file_handler])
 
         return logging.getLogger(__name__)
 
@@ -98,65 +215,139 @@ class LoggerManager:
     def restore_logging(self):
         self.logger.setLevel(self.original_log_level)
 
-    def log_org_wide_report_data(self, response):
-        """Logs the provided data as a table using Rich and logs raw data to app.log"""
-        # For cleaner logs
-        self.suppress_logging()
+    def print_report_table(self, columns, rows, total_rows):
+        """
+        Render rows as a Rich table, capped at MAX_DISPLAY_ROWS. Skipped when the console is not a
+        terminal (piped output, CI), where the table is unreadable and its layout cost is pure overhead.
+        """
+        if not self.console.is_terminal:
+            return
 
         table = Table(show_header=True, header_style="bold magenta")
-        columns = ["name", "lat", "lng", "address", "notes", "tags", "networkId",
-                   "serial", "model", "mac", "lanIp", "firmware", "productType"]
-
         for col in columns:
-            table.add_column(col.capitalize())
-
-        # Data extraction with `get()` to handle missing keys gracefully
-        for item in response:
-            table.add_row(
-                item.get("name", ""),
-                str(item.get("lat", "")),
-                str(item.get("lng", "")),
-                item.get("address", ""),
-                item.get("notes", ""),
-                ", ".join(item.get("tags", [])),
-                item.get("networkId", ""),
-                item.get("serial", ""),
-                item.get("model", ""),
-                item.get("mac", ""),
-                item.get("lanIp", ""),
-                item.get("firmware", ""),
-                item.get("productType", "")
-            )
+            table.add_column(col, no_wrap=True)
+
+        for row in itertools.islice(rows, self.MAX_DISPLAY_ROWS):
+            table.add_row(*row)
 
         self.console.print(table)
-        self.logger.info(json.dumps(response))
+        if total_rows > self.MAX_DISPLAY_ROWS:
+            self.console.print(f"... {total_rows - self.MAX_DISPLAY_ROWS} more rows omitted.")
+
+    def log_org_wide_report_data(self, response):
+        """Logs the provided data as a table using Rich and logs raw data to app.log"""
+        if not response:  # Nothing to render or serialize
+            self.logger.debug("Empty org-wide report response, nothing to log.")
+            return
+
+        # For cleaner logs
+        self.suppress_logging()
+
+        # Data extraction with `get()` to handle missing keys gracefully; rows are built lazily, only displayed ones are materialized
+        rows = ((
+            item.get("name", ""),
+            str(item.get("lat", "")),
+            str(item.get("lng", "")),
+            item.get("address", ""),
+            item.get("notes", ""),
+            ", ".join(item.get("tags", [])),
+            item.get("networkId", ""),
+            item.get("serial", ""),
+            item.get("model", ""),
+            item.get("mac", ""),
+            item.get("lanIp", ""),
+            item.get("firmware", ""),
+            item.get("productType", "")
+        ) for item in response)
+
+        self.print_report_table(self.ORG_WIDE_COLUMNS, rows, len(response))
+        self.logger.info("%s", LazyJson(response))
         self.restore_logging()
 
     def log_network_report_data(self, response):
         """Logs the provided device clients data as a table using Rich and logs raw data to app.log"""
+        if not response:  # Nothing to render or serialize
+            self.logger.debug("Empty network report response, nothing to log.")
+            return
+
         self.suppress_logging()
 
-        table = Table(show_header=True, header_style="bold magenta")
-        columns = ["id", "description", "mac", "ip", "user", "vlan", "switchport"]
+        # Improved data extraction with `get()` to handle missing keys gracefully
+        rows = ((
+            str(item.get("id", "")),
+            str(item.get("description", "")),
+            str(item.get("mac", "")),
+            str(item.get("ip", "")),
+            str(item.get("user", "")),
+            str(item.get("vlan", "")),
+            str(item.get("switchport", "None"))
+        ) for item in response)
+
+        self.print_report_table(self.NETWORK_COLUMNS, rows, len(response))
+        self.logger.info("%s", LazyJson(response))
+        self.restore_logging()
 
-        for col in columns:
-            table.add_column(col.capitalize())
 
-        # Improved data extraction with `get()` to handle missing keys gracefully
-        for item in response:
-            table.add_row(
-                str(item.get("id", "")),
-                str(item.get("description", "")),
-                str(item.get("mac", "")),
-                str(item.get("ip", "")),
-                str(item.get("user", "")),
-                str(item.get("vlan", "")),
-                str(item.get("switchport", "None"))
-            )
+class CacheManager:
+    """
+    File-backed TTL cache for Dashboard responses that rarely change (organizations, networks).
+    Entries are keyed per API key so switching keys never returns another account's data.
+    """
+    CACHE_FILE = os.path.join(os.path.expanduser("~"), ".meraki_client_history", "cache.json")
+    enabled = True
 
-        self.console.print(table)
-        self.logger.info(json.dumps(response))
-        self.restore_logging()
+    @classmethod
+    def make_key(cls, endpoint, *args):
+        api_key_hash = hashlib.sha1((EnvironmentManager.MERAKI_API_KEY or "").encode()).hexdigest()
+        return hashlib.sha1((endpoint + "".join(map(str, args)) + api_key_hash).encode()).hexdigest()
+
+    @classmethod
+    def load(cls):
+        try:
+            with open(cls.CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):  # Missing or corrupt cache file is treated as empty
+            return {}
+
+    @classmethod
+    def get(cls, key):
+        entry = cls.load().get(key)
+        if entry and time.time() - entry["timestamp"] < EnvironmentManager.CACHE_TTL_SECONDS:
+            return entry["data"]
+        return None
+
+    @classmethod
+    def set(cls, key, data):
+        cache = cls.load()
+        cache[key] = {"timestamp": time.time(), "data": data}
+        try:
+            os.makedirs(os.path.dirname(cls.CACHE_FILE), exist_ok=True)
+            tmp_file = f"{cls.CACHE_FILE}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_file, cls.CACHE_FILE)
+        except OSError:
+            pass  # Caching is best effort; never fail a report because the cache is not writable
+
+
+def cached(endpoint):
+    """
+    Decorator serving a Dashboard call from CacheManager while the entry is within TTL.
+    The wrapped function's positional args (after dashboard) form part of the cache key.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(dashboard, *args):
+            if not CacheManager.enabled:
+                return func(dashboard, *args)
+            key = CacheManager.make_key(endpoint, *args)
+            data = CacheManager.get(key)
+            if data is None:
+                data = func(dashboard, *args)
+                CacheManager.set(key, data)
+            return data
+        return wrapper
+    return decorator
 
 
 class InvalidArgumentsError(Exception):
@@ -179,10 +370,14 @@ class ArgumentParserManager:
         parser.add_argument('--raw',
                             action='store_true',
                             help='If present, export all raw data.')
+        parser.add_argument('--no-cache',
+                            action='store_true',
+                            help='If present, bypass the organization/network cache.')
 
         args = parser.parse_args()
         product_type = args.option.lower()
         raw_data = args.raw
+        use_cache = not args.no_cache
 
         valid_options = ["wired", "wireless", "all"]
         if product_type not in valid_options:
@@ -190,28 +385,44 @@ class ArgumentParserManager:
             logger_manager.console.print(error_message)
             raise InvalidArgumentsError(error_message)
 
-        return product_type, raw_data
+        return product_type, raw_data, use_cache
 
 
-def get_oui_from_mac(mac_address):
+def to_scalar(value):
     """
-    Get the Organizationally Unique Identifier (OUI) from a MAC address.
+    Coerce an API value into a scalar xlsxwriter/pyarrow can write; nested dicts/lists become text.
     """
-    return mac_address[:8]  # Slice to get the first 8 characters (OUI)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+@cached("getOrganizations")
+def fetch_organizations(dashboard):
+    # Only id and name are used for org selection, so that is all the cache file has to hold
+    return [{"id": org["id"], "name": org["name"]} for org in dashboard.organizations.getOrganizations()]
+
 
+@functools.lru_cache(maxsize=8)  # In-process memo on top of the TTL file cache (also applies with --no-cache)
+@cached("getOrganizationNetworks")
+def fetch_organization_networks(dashboard, org_id):
+    return dashboard.organizations.getOrganizationNetworks(organizationId=org_id, total_pages='all', perPage=100000)
 
+
+@functools.lru_cache(maxsize=4)
 def get_org_id(dashboard, logger_manager):
     """
     Fetch the org ID based on org name, or prompt the user to select
     an organization if the name is left blank or is invalid. If there is only one
     organization, it selects that organization automatically. Exits the script if
-    the organization is not found or if there's an error fetching the organizations.
+    there's an error fetching the organizations.
+    The result is memoized per dashboard instance, so repeat calls neither hit the API nor re-prompt.
     """
-    console = Console()
+    from meraki.exceptions import APIError
 
     with console.status("[bold green]Fetching Meraki Organizations....", spinner="dots"):
         try:
-            orgs = dashboard.organizations.getOrganizations()
+            orgs = fetch_organizations(dashboard)
         except APIError as e:
             logger_manager.logger.error(f"Failed to fetch organizations. Error: {e.message['errors'][0]}")
             sys.exit(1)
@@ -223,161 +434,278 @@ def get_org_id(dashboard, logger_manager):
     if len(orgs) == 1:
         print(f"Working with Org: {orgs[0]['name']}\n")
         return orgs[0]["id"]
-    org_names = [org["name"] for org in orgs]
+    orgs_by_name = {org["name"]: org for org in orgs}
     print("Available organizations:")
-    for org in orgs:
-        console.print(f"- {org['name']}")
+    for org_name in orgs_by_name:
+        console.print(f"- {org_name}")
     console.print("[bold red]\nNote: Meraki organization names are case sensitive")
+    # Prompt only accepts one of the choices, so the lookup below always succeeds
     selection = Prompt.ask(
-        "Which organization should we use?", choices=org_names, show_choices=False
+        "Which organization should we use?", choices=list(orgs_by_name), show_choices=False
     )
-    organization_name = selection  # Update organization_name with the user's selection
-
-    for org in orgs:
-        if org["name"] == organization_name:
-            return org["id"]
-
-    logger_manager.logger.error(f"Organization with name '{organization_name}' not found.")
-    exit(1)
+    return orgs_by_name[selection]["id"]
 
 
 def get_networks_in_org(dashboard, org_id, product_type=None):
-    console = Console()
     """
     Collect existing Meraki network names / IDs
     """
     console.print(Panel.fit("[bold bright_green]Retrieving Network(s) Information[/bold bright_green]", title="Step 3"))
     # Fetching the networks before applying any filter.
     try:
-        response = dashboard.organizations.getOrganizationNetworks(organizationId=org_id)
+        response = fetch_organization_networks(dashboard, org_id)
     except Exception as e:  # Handle exception for API call
         console.print(f"[bold red]Failed to retrieve networks: {str(e)}[/bold red]")
         sys.exit(1)
 
-    if product_type:
-        # Filter networks by product type
-        response = [network for network in response if product_type in network['productTypes']]
+    # Skip networks that cannot have the requested client type before spending an API call on them;
+    # the per-client ssid filter still applies since a network can mix product types
+    wanted_product_types = PRODUCT_TYPES_BY_CLIENT_TYPE.get(product_type)
+    if wanted_product_types:
+        response = [network for network in response if not wanted_product_types.isdisjoint(network['productTypes'])]
 
     print(f"Found {len(response)} networks.")
     return response
 
 
-def get_clients_for_network(dashboard, network, product_type, logger_manager, timespan, raw_data=False):
+async def get_clients_for_network(aio_dashboard, semaphore, network, product_type, logger_manager, timespan, raw_data=False):
+    from meraki.exceptions import AsyncAPIError
+
     network_data = {
         "network_info": network,
         "clients": []
     }
     try:
-        clients = dashboard.networks.getNetworkClients(network['id'], total_pages='all', timespan=timespan)
-
-        if raw_data:  # if all_data is True, include all the data without filtering
-            network_data["clients"].extend(clients)
-            return network_data
-
-        if product_type == "wireless":
-            clients = [client for client in clients if 'ssid' in client and client['ssid'] is not None]
-        elif product_type == "wired":
-            clients = [client for client in clients if 'ssid' not in client or client['ssid'] is None]
+        async with semaphore:
+            # perPage=1000 is the endpoint's maximum (SDK default is 10), minimizing pagination round trips.
+            # Pages stream in as an async iterator (the SDK prefetches the next page while the current one
+            # is consumed), so clients are filtered as they arrive instead of after the full response is held
+            pages = aio_dashboard.networks.getNetworkClients(network['id'], total_pages='all', perPage=1000, timespan=timespan)
+
+            if raw_data:  # if all_data is True, include all the data without filtering
+                network_data["clients"] = [client async for client in pages]
+                return network_data
+
+            if product_type == "wireless":
+                clients = [client async for client in pages if client.get('ssid') is not None]
+            elif product_type == "wired":
+                clients = [client async for client in pages if client.get('ssid') is None]
+            else:
+                clients = [client async for client in pages]
 
         if clients:
-            network_data["clients"].extend(clients)
+            network_data["clients"] = clients
             return network_data
         else:
             return None
-    except meraki.APIError as e:
+    except AsyncAPIError as e:
         logger_manager.logger.error(f"Failed to get clients for network with network id: {network['id']}. Error: {e}")
         return None
 
 
-def get_network_client_data(dashboard, org_id, product_type, logger_manager, timespan, raw_data=False):
-    console = Console()
-    all_network_data = []
-    networks = get_networks_in_org(dashboard, org_id)
+async def get_network_client_data(dashboard, org_id, product_type, logger_manager, progress, timespan, raw_data=False, max_workers=5):
+    """
+    Fetch client history for every network in the org. Calls are I/O bound, so they run
+    concurrently on the SDK's asyncio client, capped at max_workers in flight; the SDK
+    backs off on 429s (wait_on_rate_limit).
+    Note: the Dashboard API has no org-wide client listing (getOrganizationClientsSearch
+    requires a MAC, getOrganizationClientsOverview only returns totals), so clients must
+    be fetched per network.
+    """
+    import meraki.aio
+
+    networks = get_networks_in_org(dashboard, org_id, product_type)
 
-    for network in track(networks, description="Fetching Network Client History..."):
-        network_data = get_clients_for_network(dashboard, network, product_type, logger_manager, timespan)
-        if network_data:
-            all_network_data.append(network_data)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async with meraki.aio.AsyncDashboardAPI(api_key=EnvironmentManager.MERAKI_API_KEY, **DASHBOARD_API_SETTINGS,
+                                            maximum_concurrent_requests=max_workers,
+                                            use_iterator_for_get_pages=True) as aio_dashboard:
+        tasks = [asyncio.ensure_future(get_clients_for_network(aio_dashboard, semaphore, network, product_type, logger_manager, timespan, raw_data))
+                 for network in networks]
+        fetch_task = progress.add_task("Fetching Network Client History...", total=len(tasks))
+        for task in asyncio.as_completed(tasks):
+            await task
+            progress.advance(fetch_task)
+
+    # Collect in submission order so the report keeps the org's network ordering
+    all_network_data = [task.result() for task in tasks if task.result()]
 
     console.print("[bold bright_green]Network retrieval done!\r\n")
     return all_network_data
 
 
-def export_data_to_excel(data, output_dir="/app/reports", raw_data=False):
-    console = Console()
-    console.print(Panel.fit("[bold bright_green]Export Data to Excel[/bold bright_green]", title="Step 4"))
+def unique_sheet_name(name, used_names):
+    """
+    Turn a network name into a valid Excel sheet name: at most 30 characters, no []:*?/\\, no
+    leading or trailing apostrophe and not already in `used_names` (compared case-insensitively, as
+    Excel does). Repeats get a numeric suffix instead of failing the export. The returned name is
+    added to `used_names`.
+    """
+    base_name = INVALID_SHEET_NAME_CHARS.sub("_", name)[:30].strip("'") or "Unknown"
+    sheet_name, suffix = base_name, 1
+    while sheet_name.lower() in used_names:
+        sheet_name = f"{base_name[:30 - len(str(suffix)) - 1]}_{suffix}"
+        suffix += 1
+    used_names.add(sheet_name.lower())
+    return sheet_name
+
+
+def build_report_frame(network_info, clients, columns, raw_data=False):
+    """
+    Build one network's report rows as a DataFrame with column-wise (vectorized) transforms
+    instead of a per-client dict. Missing values are returned as None, ordered by `columns`.
+    """
+    import pandas as pd
+
+    if raw_data:
+        df = pd.DataFrame(clients, dtype=object)
+    else:
+        df = pd.DataFrame(clients, columns=[*CLIENT_FIELD_MAP, "usage"], dtype=object)
+        df["OUI"] = df["mac"].str.slice(0, 8)
+        for field in ("firstSeen", "lastSeen"):
+            # "YYYY-MM-DDTHH:MM:SS[.fff]Z" -> "YYYY-MM-DD HH:MM:SS" by slicing; non-ISO values are blanked
+            timestamps = df[field]
+            is_iso = timestamps.str.match(ISO_TIMESTAMP_PREFIX, na=False).astype(bool)
+            df[field] = timestamps.str.slice(0, 10).str.cat(timestamps.str.slice(11, 19), sep=" ").where(is_iso)
+        usage = df["usage"].map(lambda u: u if isinstance(u, dict) else {})
+        df["Sent Data"] = usage.map(lambda u: u.get("sent"))
+        df["Received Data"] = usage.map(lambda u: u.get("recv"))
+        df["recentDeviceSerial"] = df["recentDeviceSerial"].fillna("Unknown")
+        df = df.rename(columns=CLIENT_FIELD_MAP)
+
+    df.insert(0, "Network Name", network_info.get("name", "Unknown"))
+    df = df.reindex(columns=columns).astype(object)
+    return df.where(df.notna(), None)
+
+
+def get_report_columns(data, raw_data=False):
+    """
+    Column order for an exported report. Raw rows carry every API field, so their keys are unioned
+    up front to know the full header before any row is written.
+    """
+    if raw_data:
+        return ["Network Name"] + list(dict.fromkeys(key for network_data in data for client in network_data["clients"] for key in client))
+    return REPORT_COLUMNS
 
-    current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"Client_History_Report_{current_time}.xlsx"
+
+def prepare_report_path(data, output_dir, extension, run_timestamp=None):
+    """
+    Full path of the report file for this run, creating `output_dir` if needed.
+    Returns None when no network has any clients, so there is nothing to export.
+    """
+    if not any(network_data["clients"] for network_data in data):
+        return None
+
+    current_time = run_timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"Client_History_Report_{current_time}.{extension}"
 
     # Ensure output directory exists or create it
     os.makedirs(output_dir, exist_ok=True)
 
     # Combine the desired directory with the filename
-    full_filepath = os.path.join(output_dir, filename)
-    has_data = any(network_data["clients"] for network_data in data)
+    return os.path.join(output_dir, filename)
+
+
+def export_data_to_excel(data, progress, output_dir="/app/reports", raw_data=False, run_timestamp=None):
+    import pandas as pd
 
-    if not has_data:
+    console.print(Panel.fit("[bold bright_green]Export Data to Excel[/bold bright_green]", title="Step 4"))
+
+    full_filepath = prepare_report_path(data, output_dir, "xlsx", run_timestamp)
+    if full_filepath is None:
         console.print("No data available to export to Excel. Exiting...")
         return
-
-    with pd.ExcelWriter(full_filepath) as writer:
-        summary_data = []
+    filename = os.path.basename(full_filepath)
+
+    columns = get_report_columns(data, raw_data)
+
+    # constant_memory streams each row to disk once the next row is written, so rows are written
+    # in order with write_row (pandas' to_excel writes column by column, which that mode drops).
+    # MACs, IPs and descriptions are written as plain strings, so skip xlsxwriter's per-cell
+    # number/formula/URL detection
+    excel_options = {
+        'constant_memory': True,
+        'strings_to_numbers': False,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+    }
+    with pd.ExcelWriter(full_filepath, engine='xlsxwriter', engine_kwargs={'options': excel_options}) as writer:
+        workbook = writer.book
+        summary_sheet = workbook.add_worksheet('Summary')
+        summary_sheet.write_row(0, 0, columns)
+        summary_row = 1
+        sheet_names = {'summary'}
 
         # Write data to Excel, network by network
-        for network_data in track(data, description="[cyan]Creating Excel File..."):
+        for network_data in progress.track(data, description="[cyan]Creating Excel File..."):
             network_info = network_data["network_info"]
             clients = network_data["clients"]
 
             if not clients:
                 continue
 
-            relevant_client_data = []
-            for client in clients:
-                if raw_data:
-                    client_info = {
-                        "Network Name": network_info.get("name", "Unknown"),
-                        **client  # Include all original client data
-                    }
-                else:
-                    client_info = {
-                        "Network Name": network_info.get("name", "Unknown"),
-                        "IP Address": client.get("ip"),
-                        "MAC Address": client.get("mac"),
-                        "OUI": get_oui_from_mac(client.get("mac", "")),
-                        "Manufacturer": client.get("manufacturer"),
-                        "Description": client.get("description"),
-                        "SSID": client.get("ssid"),
-                        "OS": client.get("os"),
-                        "First Seen": datetime.strptime(client.get("firstSeen"), "%Y-%m-%dT%H:%M:%SZ").strftime('%Y-%m-%d %H:%M:%S') if client.get("firstSeen") else None,
-                        "Last Seen": datetime.strptime(client.get("lastSeen"), '%Y-%m-%dT%H:%M:%SZ').strftime('%Y-%m-%d %H:%M:%S') if client.get("lastSeen") else None,
-                        "Status": client.get("status"),
-                        "Sent Data": client.get("usage", {}).get("sent"),
-                        "Received Data": client.get("usage", {}).get("recv"),
-                        "User": client.get("user"),
-                        "Meraki Device Serial (Connected to)": client.get("recentDeviceSerial", "Unknown")
-                    }
-
-                relevant_client_data.append(client_info)
-                summary_data.append(client_info)
-
-            sheet_name = network_info.get("name", "Unknown")
-            if len(sheet_name) > 30:
-                sheet_name = sheet_name[:30]
-
-            df = pd.DataFrame(relevant_client_data)
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # Write summary data
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+            sheet_name = unique_sheet_name(network_info.get("name", "Unknown"), sheet_names)
+            df = build_report_frame(network_info, clients, columns, raw_data)
+
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, columns)
+            for row, values in enumerate(df.itertuples(index=False, name=None), start=1):
+                values = [to_scalar(value) for value in values]
+                worksheet.write_row(row, 0, values)
+                summary_sheet.write_row(summary_row, 0, values)
+                summary_row += 1
 
         console.print(f"Data exported successfully to {filename}.")
         console.print("\n")
 
 
+def export_data_to_columnar(data, progress, report_format, output_dir="/app/reports", raw_data=False, run_timestamp=None):
+    """
+    Export every client as one long-form table (network name as a column) in Parquet or Feather format.
+    Much faster to write and smaller on disk than xlsx, for reports that are post-processed programmatically.
+    """
+    import pandas as pd
+
+    console.print(Panel.fit(f"[bold bright_green]Export Data to {report_format.capitalize()}[/bold bright_green]", title="Step 4"))
+
+    full_filepath = prepare_report_path(data, output_dir, report_format, run_timestamp)
+    if full_filepath is None:
+        console.print(f"No data available to export to {report_format.capitalize()}. Exiting...")
+        return
+    filename = os.path.basename(full_filepath)
+
+    columns = get_report_columns(data, raw_data)
+    frames = [build_report_frame(network_data["network_info"], network_data["clients"], columns, raw_data)
+              for network_data in progress.track(data, description=f"[cyan]Creating {report_format.capitalize()} File...")
+              if network_data["clients"]]
+    df = pd.concat(frames, ignore_index=True)
+    if raw_data:
+        df = df.map(to_scalar)  # Nested API values (usage, etc.) are stored as text, as in the Excel report
+        # Raw fields are not typed by the API (e.g. vlan can be "1" on one client and 2 on another),
+        # and Arrow needs one type per column, so columns holding mixed scalar types are stored as text
+        for column in df.columns:
+            if df[column].dropna().map(type).nunique() > 1:
+                df[column] = df[column].map(lambda value: None if value is None else str(value))
+    else:
+        df = df.astype(REPORT_DTYPES)  # Typed columns instead of inferred object boxes
+
+    if report_format == "parquet":
+        df.to_parquet(full_filepath, compression="zstd", index=False)
+    else:
+        df.to_feather(full_filepath)
+
+    console.print(f"Data exported successfully to {filename}.")
+    console.print("\n")
+
+
 def print_final_table(all_network_data, raw_data=False):
-    console = Console()
+    """
+    Print the client report to the console. Only the first MAX_TABLE_ROWS clients are rendered
+    to keep the terminal responsive; the Excel export always contains every row.
+    """
+    import pandas as pd
+
     table = Table(show_header=True, header_style="bold magenta")
     if raw_data:
         columns = ["id", "mac", "ip", "ip6", "description", "firstSeen", "lastSeen", "manufacturer",
@@ -386,45 +714,48 @@ def print_final_table(all_network_data, raw_data=False):
                    "deviceTypePrediction", "recentDeviceSerial", "recentDeviceName", "recentDeviceConnection",
                    "notes", "ip6Local", "groupPolicy8021x", "pskGroup"]
     else:
-        columns = ["IP", "MAC", "OUI", "Manufacturer", "Description", "SSID", "OS", "First Seen", "Last Seen",
-                   "Status", "Sent Data", "Received Data", "User", "Meraki Device Serial (Connected to)"]
+        columns = REPORT_COLUMNS[1:]  # Network name is implied by the Excel sheet, not shown here
 
     # Add columns to the table
     for col in columns:
         table.add_column(col)
 
-    # Add data to the table
+    # Build one flattened frame from the first MAX_TABLE_ROWS clients, network by network
+    frames = []
+    remaining = MAX_TABLE_ROWS
     for network_data in all_network_data:
-        for client in network_data["clients"]:
-            if raw_data:
-                row_data = [str(client.get(col, "")) for col in columns]
-            else:
-                row_data = [
-                        client.get("ip", ""),
-                        client.get("mac", ""),
-                        get_oui_from_mac(client.get("mac", "")),
-                        client.get("manufacturer", ""),
-                        client.get("description", ""),
-                        client.get("ssid", ""),
-                        client.get("os", ""),
-                        client.get("firstSeen", ""),
-                        client.get("lastSeen", ""),
-                        client.get("status", ""),
-                        str(client.get("usage", {}).get("sent", "")),
-                        str(client.get("usage", {}).get("recv", "")),
-                        client.get("user", ""),
-                        client.get("recentDeviceSerial", "Unknown")
-                ]
-            table.add_row(*row_data)
+        clients = network_data["clients"][:remaining]
+        if clients:
+            frames.append(build_report_frame(network_data["network_info"], clients, columns, raw_data))
+            remaining -= len(clients)
+        if remaining <= 0:
+            break
+
+    # Add data to the table
+    if frames:
+        for row in pd.concat(frames, ignore_index=True).itertuples(index=False, name=None):
+            table.add_row(*("" if value is None else str(value) for value in row))
 
     console.print(Panel.fit(table, title="Final Report"))
 
+    total_clients = sum(len(network_data["clients"]) for network_data in all_network_data)
+    if total_clients > MAX_TABLE_ROWS:
+        console.print(f"... {total_clients - MAX_TABLE_ROWS} more rows omitted. Enable EXCEL to export every row.")
 
-def run_report(dashboard, org_id, product_type, logger_manager, timespan, excel, raw_data=False):
-    all_network_data = get_network_client_data(dashboard, org_id, product_type, logger_manager, timespan, raw_data)
-    if excel:
-        export_data_to_excel(all_network_data, "/app/reports", raw_data)
-        logger_manager.logger.info("Excel report generated!")
+
+def run_report(dashboard, org_id, product_type, logger_manager, timespan, excel, raw_data=False, max_workers=5, report_format="xlsx"):
+    # One timestamp per run, so every file a run writes carries the same name suffix
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    # One live progress display shared by the fetch and export phases
+    with Progress(console=logger_manager.console) as progress:
+        all_network_data = asyncio.run(get_network_client_data(dashboard, org_id, product_type, logger_manager, progress, timespan, raw_data, max_workers))
+        if excel:
+            if report_format == "xlsx":
+                export_data_to_excel(all_network_data, progress, "/app/reports", raw_data, run_timestamp)
+            else:
+                export_data_to_columnar(all_network_data, progress, report_format, "/app/reports", raw_data, run_timestamp)
+            logger_manager.logger.info(f"{report_format} report generated!")
     print_final_table(all_network_data, raw_data)
     return True
 